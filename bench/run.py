@@ -0,0 +1,257 @@
+import sys
+import json
+import math
+import argparse
+import tempfile
+from collections import defaultdict
+from unittest import mock
+from bench.stubs import StubOCRReader, offline_environment, write_sample_pdf
+from services import OCRManager, VectorStoreManager, telemetry
+from config import Config
+
+# Each "<tool name>: <argument>" line makes the fake LLM call that tool
+AGENT_QUERIES = [
+    "calculator_tool: 37593 * 67",
+    "weather_tool: Cairo",
+    "wikipedia: Eiffel Tower",
+    "search_docs_tool: vector store",
+    "What can you do?",
+]
+SEARCH_QUERY = "How does the vector store retrieve chunks?"
+IMAGE_URL = "https://example.com/receipt.png"
+
+
+class BenchmarkRunner:
+    """Runs the offline benchmark scenarios and aggregates their span timings"""
+
+    def __init__(self, workdir: str):
+        # Imported here so the tools' module-level vectorstore is created with stubbed embeddings
+        from models import LLMFactory, AgentManager
+        from tools import ToolsManager
+
+        self.pdf_path = write_sample_pdf(f"{workdir}/sample.pdf")
+
+        # Fixed index queried by the search scenario and by search_docs_tool; never modified
+        self.search_manager = VectorStoreManager()
+        self.search_manager.add_document_to_vectorstore(self.pdf_path)
+
+        # Separate index rebuilt from scratch on every ingest so each one does the same work
+        self.ingest_path = f"{workdir}/ingest_index"
+        self.ingest_manager = VectorStoreManager()
+
+        self.ocr_manager = OCRManager()
+        self.ocr_manager.ocr_reader = StubOCRReader()
+
+        self.agent_manager = AgentManager()
+        self.agent = self.agent_manager.create_react_agent(
+            LLMFactory.create_llm("fake"), ToolsManager().get_all_tools()
+        )
+        self.samples = defaultdict(list)
+
+    def run_iteration(self, iteration: int, record: bool = True):
+        """Runs every scenario once, recording span durations if requested"""
+        traces = []
+
+        with mock.patch.object(Config, "VECTORSTORE_PATH", self.ingest_path):
+            self.ingest_manager.reset_vectorstore()
+            with telemetry.trace("bench.ingest") as trace:
+                self.ingest_manager.add_document_to_vectorstore(self.pdf_path)
+        traces.append(trace)
+
+        with telemetry.trace("bench.search") as trace:
+            self.search_manager.search_documents(SEARCH_QUERY)
+        traces.append(trace)
+
+        with telemetry.trace("bench.ocr") as trace:
+            image = self.ocr_manager.load_image_from_url(IMAGE_URL)
+            self.ocr_manager.extract_text_from_image(image)
+        traces.append(trace)
+
+        for query in AGENT_QUERIES:
+            with telemetry.trace("bench.agent") as trace:
+                self.agent_manager.get_agent_response(self.agent, query, f"bench-{iteration}")
+            traces.append(trace)
+
+        if record:
+            for trace in traces:
+                for span in trace["spans"]:
+                    self.samples[span["name"]].append(span["duration_ms"])
+
+    def summary(self) -> dict:
+        """Returns count, mean, p50, p95 and max (ms) for every span name"""
+        return {name: summarize(values) for name, values in sorted(self.samples.items())}
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: list) -> dict:
+    """Aggregates duration samples (ms) into summary statistics"""
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "p50_ms": percentile(values, 50),
+        "p95_ms": percentile(values, 95),
+        "max_ms": max(values),
+    }
+
+
+def format_table(spans: dict) -> str:
+    """Formats a span summary as a fixed-width text table"""
+    width = max([len(name) for name in spans] + [4])
+    header = f"{'span':<{width}}  {'count':>6}  {'mean_ms':>10}  {'p50_ms':>10}  {'p95_ms':>10}  {'max_ms':>10}"
+    rows = [header, "-" * len(header)]
+    for name, stats in spans.items():
+        rows.append(
+            f"{name:<{width}}  {stats['count']:>6}  {stats['mean_ms']:>10.3f}  "
+            f"{stats['p50_ms']:>10.3f}  {stats['p95_ms']:>10.3f}  {stats['max_ms']:>10.3f}"
+        )
+    return "\n".join(rows)
+
+
+def find_regressions(current: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """
+    Compares p50 latencies of spans present in both summaries
+
+    Args:
+        current: Span summary of this run
+        baseline: Span summary of a previous run
+        tolerance: Allowed relative slowdown (0.2 means 20%)
+        min_delta_ms: Absolute slowdown below which differences are ignored as noise
+
+    Returns:
+        List of (span name, baseline p50, current p50) for regressed spans
+    """
+    regressions = []
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["p50_ms"], stats["p50_ms"]
+        if after > before * (1 + tolerance) and after - before > min_delta_ms:
+            regressions.append((name, before, after))
+    return regressions
+
+
+def config_mismatches(current: dict, baseline: dict) -> list:
+    """
+    Lists run settings that differ between two benchmark results
+
+    Args:
+        current: Config of this run
+        baseline: Config stored with a previous run
+
+    Returns:
+        List of (setting, baseline value, current value) for differing settings
+    """
+    return [
+        (key, baseline.get(key), value)
+        for key, value in current.items()
+        if baseline.get(key) != value
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Offline latency benchmark using a fake LLM and stubbed HTTP tools"
+    )
+    parser.add_argument("--iterations", type=int, default=20, help="measured iterations")
+    parser.add_argument("--warmup", type=int, default=2, help="unrecorded warmup iterations")
+    parser.add_argument("--llm-latency", type=float, default=0.0,
+                        help="simulated seconds per fake LLM call")
+    parser.add_argument("--http-latency", type=float, default=0.0,
+                        help="simulated seconds per stubbed HTTP call")
+    parser.add_argument("--output", help="write the span summary as JSON to this file")
+    parser.add_argument("--baseline", help="JSON summary of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative p50 slowdown before failing (default 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore p50 slowdowns smaller than this many ms")
+    parser.add_argument("--trace-dir", default="", help="dump per-request traces to this directory")
+    parser.add_argument("--metrics", action="store_true",
+                        help="print the Prometheus metrics collected during the run")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir, offline_environment(
+        workdir, args.http_latency, args.llm_latency, args.trace_dir
+    ):
+        runner = BenchmarkRunner(workdir)
+        for i in range(args.warmup):
+            runner.run_iteration(i, record=False)
+
+        telemetry.reset()
+        for i in range(args.iterations):
+            runner.run_iteration(args.warmup + i)
+
+    spans = runner.summary()
+    print(format_table(spans))
+
+    if args.metrics:
+        print()
+        print(telemetry.render_metrics(), end="")
+
+    config = {
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "llm_latency": args.llm_latency,
+        "http_latency": args.http_latency,
+    }
+    return compare_and_save(spans, config, args)
+
+
+def compare_and_save(spans: dict, config: dict, args) -> int:
+    """
+    Checks the run against --baseline, then writes it to --output
+
+    The baseline is read before the output is written, so passing the same
+    file to both compares against the previous run and then refreshes it.
+
+    Args:
+        spans: Span summary of this run
+        config: Settings of this run
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit status: 0 if clean, 1 on regressions, 2 on a settings mismatch
+    """
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        status = check_baseline(spans, config, baseline, args)
+
+    if args.output:
+        result = {"config": config, "spans": spans}
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+    return status
+
+
+def check_baseline(spans: dict, config: dict, baseline: dict, args) -> int:
+    """Prints settings mismatches or p50 regressions against a baseline and returns the exit status"""
+    mismatches = config_mismatches(config, baseline.get("config", {}))
+    for key, before, after in mismatches:
+        print(f"CONFIG MISMATCH {key}: baseline {before!r}, current {after!r}")
+    if mismatches:
+        print(f"Cannot compare against {args.baseline}: rerun with the baseline's settings")
+        return 2
+
+    regressions = find_regressions(spans, baseline["spans"], args.tolerance, args.min_delta_ms)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: p50 {before:.3f} ms -> {after:.3f} ms")
+    if regressions:
+        return 1
+    print(f"No p50 regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import os
+import time
+from io import BytesIO
+from contextlib import ExitStack, contextmanager
+from unittest import mock
+from PIL import Image
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_community.utilities import WikipediaAPIWrapper
+from config import Config
+
+SAMPLE_LINES = [
+    "FAISS is a library for efficient similarity search of dense vectors.",
+    "A vector store keeps document embeddings and retrieves the closest chunks.",
+    "LangGraph agents call tools in a loop until the model produces an answer.",
+    "Checkpointers persist the conversation state of every agent thread.",
+    "EasyOCR extracts printed text from images in many languages.",
+]
+
+
+class StubResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, text: str = "", content: bytes = b"", status_code: int = 200):
+        self.text = text
+        self.content = content or text.encode("utf-8")
+        self.status_code = status_code
+
+
+class StubHTTP:
+    """Deterministic replacement for requests.get with a fixed simulated latency"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.image = _render_image()
+
+    def __call__(self, url: str, *args, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+
+        if "wttr.in" in url:
+            location = url.split("wttr.in/", 1)[1].split("?", 1)[0]
+            return StubResponse(f"{location}: +25°C")
+        if url.lower().endswith((".png", ".jpg", ".jpeg")):
+            return StubResponse(content=self.image)
+        return StubResponse(status_code=404)
+
+
+class StubOCRReader:
+    """Stand-in for easyocr.Reader that returns fixed detections"""
+
+    def readtext(self, img_byte_arr):
+        return [([[0, 0], [1, 0], [1, 1], [0, 1]], line, 0.99) for line in SAMPLE_LINES[:2]]
+
+
+def _render_image() -> bytes:
+    """Renders a small PNG to serve from stubbed image URLs"""
+    buf = BytesIO()
+    Image.new("RGB", (320, 80), "white").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def write_sample_pdf(path: str, lines=SAMPLE_LINES, repeat: int = 8) -> str:
+    """
+    Writes a single-page text PDF without any PDF authoring dependency
+
+    Args:
+        path: Output file path
+        lines: Text lines to write
+        repeat: How many times the lines are repeated on the page
+
+    Returns:
+        The written path
+    """
+    text_ops = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+    for i in range(repeat):
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            text_ops.append(f"({i + 1}. {escaped}) Tj T*")
+    text_ops.append("ET")
+    stream = "\n".join(text_ops).encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(out)
+    return path
+
+
+@contextmanager
+def offline_environment(workdir: str, http_latency: float = 0.0, llm_latency: float = 0.0,
+                        trace_dir: str = ""):
+    """
+    Redirects all data paths into workdir and replaces every network-bound
+    dependency (embedding model, HTTP, Wikipedia) with deterministic stubs
+
+    Args:
+        workdir: Scratch directory for vectorstore, uploads and checkpoints
+        http_latency: Simulated latency of each stubbed HTTP call in seconds
+        llm_latency: Simulated latency of each fake LLM call in seconds
+        trace_dir: Directory for per-request trace dumps (empty disables them)
+    """
+    def search_wikipedia(self, query: str) -> str:
+        if http_latency:
+            time.sleep(http_latency)
+        return f"Page: {query}\nSummary: {query} is a stub Wikipedia article."
+
+    with ExitStack() as stack:
+        for name, value in [
+            ("VECTORSTORE_PATH", os.path.join(workdir, "vectorstore_index")),
+            ("UPLOAD_DIR", os.path.join(workdir, "uploaded_docs")),
+            ("CHECKPOINT_DB", os.path.join(workdir, "checkpoints", "checkpoint.db")),
+            ("FAKE_LLM_LATENCY", llm_latency),
+            ("TRACE_DIR", trace_dir),
+        ]:
+            stack.enter_context(mock.patch.object(Config, name, value))
+
+        stack.enter_context(mock.patch(
+            "services.vectorstore.HuggingFaceEmbeddings",
+            lambda model_name: DeterministicFakeEmbedding(size=384),
+        ))
+        stack.enter_context(mock.patch("requests.get", StubHTTP(http_latency)))
+        stack.enter_context(mock.patch.object(WikipediaAPIWrapper, "run", search_wikipedia))
+
+        Config.create_directories()
+        yield
@@ -18,9 +18,19 @@ class Config:
     UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./data/uploaded_docs")
     CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", "./data/checkpoints/checkpoint.db")
     
+    # Telemetry (METRICS_PORT=0 disables the metrics endpoint, empty TRACE_DIR disables trace dumps)
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+    TRACE_DIR = os.getenv("TRACE_DIR", "")
+    
+    # Simulated per-call latency (seconds) of the offline fake LLM used by benchmarks
+    FAKE_LLM_LATENCY = float(os.getenv("FAKE_LLM_LATENCY", "0"))
+    
     # Create directories if they don't exist
     @classmethod
     def create_directories(cls):
         os.makedirs(cls.UPLOAD_DIR, exist_ok=True)
         os.makedirs(os.path.dirname(cls.CHECKPOINT_DB), exist_ok=True)
-        os.makedirs(os.path.dirname(cls.VECTORSTORE_PATH), exist_ok=True)
\ No newline at end of file
+        os.makedirs(os.path.dirname(cls.VECTORSTORE_PATH), exist_ok=True)
+        if cls.TRACE_DIR:
+            os.makedirs(cls.TRACE_DIR, exist_ok=True)
\ No newline at end of file
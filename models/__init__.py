@@ -1,4 +1,5 @@
 from .llm import LLMFactory
 from .agents import AgentManager
+from .fake_llm import FakeChatModel
 
-__all__ = ["LLMFactory", "AgentManager"]
\ No newline at end of file
+__all__ = ["LLMFactory", "AgentManager", "FakeChatModel"]
\ No newline at end of file
@@ -6,12 +6,28 @@ from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langchain_experimental.agents import create_pandas_dataframe_agent
 from config import Config
+from services.telemetry import telemetry
+
+class TracedSqliteSaver(SqliteSaver):
+    """SqliteSaver that records checkpoint reads and writes as telemetry spans"""
+    
+    def get_tuple(self, config):
+        with telemetry.span("checkpoint.get"):
+            return super().get_tuple(config)
+    
+    def put(self, *args, **kwargs):
+        with telemetry.span("checkpoint.put"):
+            return super().put(*args, **kwargs)
+    
+    def put_writes(self, *args, **kwargs):
+        with telemetry.span("checkpoint.put_writes"):
+            return super().put_writes(*args, **kwargs)
 
 class AgentManager:
     """Manages different types of agents"""
     
     def __init__(self):
-        self.checkpointer = SqliteSaver(
+        self.checkpointer = TracedSqliteSaver(
             sqlite3.connect(Config.CHECKPOINT_DB, check_same_thread=False)
         )
     
@@ -53,15 +69,16 @@ class AgentManager:
             "content": query,
         }
         
-        for step in agent.stream({"messages": [input_message]}, config, stream_mode="values"):
-            last_msg = step["messages"][-1]
+        with telemetry.trace("agent.request", thread_id=thread_id):
+            for step in agent.stream({"messages": [input_message]}, config, stream_mode="values"):
+                last_msg = step["messages"][-1]
 
-            # Capture pretty_print() output as string
-            with io.StringIO() as buf, contextlib.redirect_stdout(buf):
-                last_msg.pretty_print()
-                printed = buf.getvalue()
+                # Capture pretty_print() output as string
+                with io.StringIO() as buf, contextlib.redirect_stdout(buf):
+                    last_msg.pretty_print()
+                    printed = buf.getvalue()
 
-            output += "\n\n" + printed
+                output += "\n\n" + printed
 
         return output
     
@@ -95,6 +112,7 @@ class AgentManager:
         Returns:
             Answer as string
         """
-        agent = self.create_dataframe_agent(llm, df)
-        result = agent.invoke(question)
+        with telemetry.trace("dataframe.request", rows=len(df)):
+            agent = self.create_dataframe_agent(llm, df)
+            result = agent.invoke(question)
         return result['output']
\ No newline at end of file
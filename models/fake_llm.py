@@ -0,0 +1,69 @@
+import time
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic offline chat model for benchmarks
+
+    Each line of the latest user message of the form "<tool name>: <argument>"
+    becomes a call to that tool (if it is bound). Once tool results come back,
+    the model answers with them. Anything else is echoed back as the answer.
+    """
+
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools, **kwargs):
+        """Binds tools using the OpenAI schema so their names and arguments are known"""
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+
+        last_message = messages[-1]
+        if isinstance(last_message, ToolMessage):
+            results = []
+            for message in reversed(messages):
+                if not isinstance(message, ToolMessage):
+                    break
+                results.insert(0, str(message.content))
+            message = AIMessage(content="Answer from tools:\n" + "\n".join(results))
+        else:
+            tool_calls = self._parse_tool_calls(str(last_message.content),
+                                                kwargs.get("tools", []), len(messages))
+            if tool_calls:
+                message = AIMessage(content="", tool_calls=tool_calls)
+            else:
+                message = AIMessage(content=f"Echo: {last_message.content}")
+
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _parse_tool_calls(content: str, tools: list, turn: int) -> list:
+        """Builds tool calls from "<tool name>: <argument>" lines"""
+        arguments = {}
+        for tool in tools:
+            function = tool["function"]
+            properties = function.get("parameters", {}).get("properties", {})
+            arguments[function["name"]] = next(iter(properties), "input")
+
+        tool_calls = []
+        for line in content.splitlines():
+            name, sep, value = line.partition(":")
+            name = name.strip()
+            if sep and name in arguments:
+                tool_calls.append({
+                    "name": name,
+                    "args": {arguments[name]: value.strip()},
+                    "id": f"call_{turn}_{len(tool_calls)}",
+                    "type": "tool_call",
+                })
+        return tool_calls
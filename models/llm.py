@@ -1,6 +1,8 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_ollama.chat_models import ChatOllama
 from config import Config
+from models.fake_llm import FakeChatModel
+from services.telemetry import TelemetryCallbackHandler
 
 class LLMFactory:
     """Factory class for creating LLM instances"""
@@ -11,14 +13,16 @@ class LLMFactory:
         Creates and returns an LLM instance based on the specified model name.
         
         Args:
-            model_name (str): Either 'llama' or 'gemini'
+            model_name (str): Either 'llama' or 'gemini' ('fake' for offline benchmarks)
             google_api_key (str): API key for Gemini (optional for Llama)
             
         Returns:
-            LLM instance
+            LLM instance instrumented with telemetry callbacks
         """
+        callbacks = [TelemetryCallbackHandler(f"llm.{model_name.lower()}")]
+        
         if model_name.lower() == "llama":
-            return ChatOllama(model=Config.LLAMA_MODEL)
+            return ChatOllama(model=Config.LLAMA_MODEL, callbacks=callbacks)
         
         elif model_name.lower() == "gemini":
             api_key = google_api_key or Config.GOOGLE_API_KEY
@@ -31,11 +35,15 @@ class LLMFactory:
                 temperature=0,
                 max_tokens=None,
                 timeout=None,
-                max_retries=2
+                max_retries=2,
+                callbacks=callbacks
             )
         
+        elif model_name.lower() == "fake":
+            return FakeChatModel(latency=Config.FAKE_LLM_LATENCY, callbacks=callbacks)
+        
         else:
-            raise ValueError("Unsupported model_name. Use 'llama' or 'gemini'.")
+            raise ValueError("Unsupported model_name. Use 'llama', 'gemini' or 'fake'.")
     
     @staticmethod
     def get_available_models():
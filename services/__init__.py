@@ -1,5 +1,14 @@
+from .telemetry import Telemetry, TelemetryCallbackHandler, telemetry, start_metrics_server
 from .vectorstore import VectorStoreManager
 from .auth import AuthManager
 from .ocr import OCRManager
 
-__all__ = ["VectorStoreManager", "AuthManager", "OCRManager"]
\ No newline at end of file
+__all__ = [
+    "VectorStoreManager",
+    "AuthManager",
+    "OCRManager",
+    "Telemetry",
+    "TelemetryCallbackHandler",
+    "telemetry",
+    "start_metrics_server",
+]
\ No newline at end of file
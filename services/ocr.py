@@ -2,6 +2,7 @@ import requests
 import easyocr
 from io import BytesIO
 from PIL import Image
+from services.telemetry import telemetry
 
 class OCRManager:
     """Manages OCR (Optical Character Recognition) operations"""
@@ -9,6 +10,7 @@ class OCRManager:
     def __init__(self):
         self.ocr_reader = None
     
+    @telemetry.traced("ocr.load_image")
     def load_image_from_url(self, image_url: str):
         """
         Load image from URL for OCR processing
@@ -27,6 +29,7 @@ class OCRManager:
         img.save(img_byte_arr, format='PNG')
         return img_byte_arr.getvalue()
     
+    @telemetry.traced("ocr.extract_text")
     def extract_text_from_image(self, img_byte_arr, languages=['en', 'ar']):
         """
         Extract text from image using OCR
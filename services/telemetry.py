@@ -0,0 +1,305 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+import functools
+import contextvars
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from langchain_core.callbacks import BaseCallbackHandler
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds (Prometheus-style, cumulative)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_NAME = "assistant_span_duration_seconds"
+
+
+class Span:
+    """A single timed operation, optionally attached to a request trace"""
+
+    def __init__(self, name: str, parent_id, trace, attributes: dict):
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.trace = trace
+        self.attributes = attributes
+        self.start_time = time.time()
+        self.started = time.perf_counter()
+        self.duration = None
+        self.error = None
+
+    def to_dict(self) -> dict:
+        """Returns a JSON-serialisable view of the span"""
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class Telemetry:
+    """Records timed spans as Prometheus-style histograms and per-request traces"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._trace = contextvars.ContextVar("telemetry_trace", default=None)
+        self._current = contextvars.ContextVar("telemetry_span", default=None)
+
+    def start_span(self, name: str, **attributes) -> Span:
+        """
+        Opens a span as a child of the current one and makes it current
+
+        Args:
+            name: Span name, also used as the metric label
+            **attributes: Extra JSON-serialisable values stored in traces
+
+        Returns:
+            The open span, to be passed to finish_span
+        """
+        span = Span(name, self._current.get(), self._trace.get(), attributes)
+        self._current.set(span.span_id)
+        return span
+
+    def finish_span(self, span: Span, error: BaseException = None):
+        """
+        Closes a span, records its duration and restores its parent as current
+
+        Args:
+            span: Span returned by start_span
+            error: Exception raised by the operation, if any
+        """
+        span.duration = time.perf_counter() - span.started
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        self._current.set(span.parent_id)
+        self.observe(span.name, span.duration, "error" if error is not None else "ok")
+
+        if span.trace is not None:
+            span.trace["spans"].append(span.to_dict())
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Context manager that times the enclosed block as a span"""
+        span = self.start_span(name, **attributes)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.finish_span(span, error)
+
+    def traced(self, name: str):
+        """Decorator that times every call of the wrapped function as a span"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @contextmanager
+    def trace(self, name: str, **attributes):
+        """
+        Context manager that collects every span of one request into a trace
+
+        Nested calls join the enclosing trace as a plain span. When
+        Config.TRACE_DIR is set, the finished trace is written there as JSON;
+        write failures are logged and never raised.
+
+        Args:
+            name: Name of the root span
+            **attributes: Extra values stored on the root span
+
+        Yields:
+            Trace dictionary with trace_id, name and the list of finished spans
+        """
+        active = self._trace.get()
+        if active is not None:
+            with self.span(name, **attributes):
+                yield active
+            return
+
+        trace = {"trace_id": uuid.uuid4().hex, "name": name, "start": time.time(), "spans": []}
+        token = self._trace.set(trace)
+        try:
+            with self.span(name, **attributes):
+                yield trace
+        finally:
+            self._trace.reset(token)
+            if Config.TRACE_DIR:
+                # Trace dumps are best-effort and must never fail or mask the request itself
+                try:
+                    self.dump_trace(trace, Config.TRACE_DIR)
+                except OSError as e:
+                    logger.warning("Could not write trace to %s: %s", Config.TRACE_DIR, e)
+
+    def dump_trace(self, trace: dict, directory: str) -> str:
+        """
+        Writes a trace to a JSON file
+
+        Args:
+            trace: Trace dictionary yielded by trace()
+            directory: Target directory, created if missing
+
+        Returns:
+            Path of the written file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{trace['name']}-{trace['trace_id']}.json")
+        payload = dict(trace, spans=sorted(trace["spans"], key=lambda s: s["start"]))
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2, default=str)
+        return path
+
+    def observe(self, name: str, seconds: float, status: str = "ok"):
+        """Adds one duration sample to the histogram for (name, status)"""
+        with self._lock:
+            histogram = self._histograms.get((name, status))
+            if histogram is None:
+                histogram = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._histograms[(name, status)] = histogram
+
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram["buckets"][i] += 1
+            histogram["sum"] += seconds
+            histogram["count"] += 1
+
+    def render_metrics(self) -> str:
+        """Returns all histograms in the Prometheus text exposition format"""
+        with self._lock:
+            snapshot = {
+                key: (list(h["buckets"]), h["sum"], h["count"])
+                for key, h in self._histograms.items()
+            }
+
+        lines = [
+            f"# HELP {METRIC_NAME} Duration of instrumented operations in seconds",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for (name, status), (buckets, total, count) in sorted(snapshot.items()):
+            labels = f'span="{_escape_label(name)}",status="{status}"'
+            for bound, value in zip(self.buckets, buckets):
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {value}')
+            lines.append(f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {total}")
+            lines.append(f"{METRIC_NAME}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Clears all recorded metrics"""
+        with self._lock:
+            self._histograms.clear()
+
+
+def _escape_label(value: str) -> str:
+    """Escapes a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class TelemetryCallbackHandler(BaseCallbackHandler):
+    """LangChain callback handler that records LLM and tool runs as spans"""
+
+    run_inline = True
+
+    def __init__(self, llm_span_name: str = "llm", registry: Telemetry = None):
+        self.llm_span_name = llm_span_name
+        self.registry = registry or telemetry
+        self._spans = {}
+
+    def _start(self, run_id, name: str):
+        self._spans[run_id] = self.registry.start_span(name)
+
+    def _end(self, run_id, error: BaseException = None):
+        span = self._spans.pop(run_id, None)
+        if span is not None:
+            self.registry.finish_span(span, error)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id, self.llm_span_name)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, self.llm_span_name)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        self._start(run_id, f"tool.{name}")
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves the telemetry registry at /metrics"""
+
+    registry = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = self.registry.render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Global registry shared by all instrumented components
+telemetry = Telemetry()
+
+_metrics_server = None
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1", registry: Telemetry = None):
+    """
+    Starts a background HTTP server exposing Prometheus metrics at /metrics
+
+    Safe to call repeatedly (e.g. on every Streamlit rerun); only the first
+    call starts a server.
+
+    Args:
+        port: TCP port to listen on
+        host: Interface to bind
+        registry: Telemetry instance to expose (defaults to the global one)
+
+    Returns:
+        The running ThreadingHTTPServer
+    """
+    global _metrics_server
+    if _metrics_server is None:
+        handler = type("MetricsRequestHandler", (_MetricsRequestHandler,),
+                       {"registry": registry or telemetry})
+        _metrics_server = ThreadingHTTPServer((host, port), handler)
+        _metrics_server.daemon_threads = True
+        threading.Thread(target=_metrics_server.serve_forever, daemon=True).start()
+    return _metrics_server
@@ -10,6 +10,7 @@ from langchain_community.document_loaders import PyPDFLoader, UnstructuredHTMLLo
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 from config import Config
+from services.telemetry import telemetry
 
 class VectorStoreManager:
     """Manages vector store operations and document processing"""
@@ -19,6 +20,7 @@ class VectorStoreManager:
         self.vectorstore = None
         self.ocr_reader = None
     
+    @telemetry.traced("vectorstore.load")
     def create_or_load_vectorstore(self):
         """Loads an existing FAISS vectorstore from disk, or creates a new one if not found"""
         if os.path.exists(Config.VECTORSTORE_PATH):
@@ -31,6 +33,7 @@ class VectorStoreManager:
             self.vectorstore = None
         return self.vectorstore
     
+    @telemetry.traced("vectorstore.save")
     def save_vectorstore(self):
         """Saves the current FAISS vectorstore to disk"""
         if self.vectorstore:
@@ -45,6 +48,7 @@ class VectorStoreManager:
         else:
             return "No vectorstore to reset."
     
+    @telemetry.traced("vectorstore.split")
     def load_and_split_document(self, file_path: str):
         """Loads and splits a PDF or HTML file into smaller chunks for embedding"""
         if file_path.lower().endswith(".pdf"):
@@ -58,6 +62,7 @@ class VectorStoreManager:
         splitter = RecursiveCharacterTextSplitter(chunk_size=250, chunk_overlap=50)
         return splitter.split_documents(documents)
     
+    @telemetry.traced("vectorstore.ingest")
     def add_document_to_vectorstore(self, file_path: str):
         """Adds a new PDF or HTML file's contents to the vector store and saves it"""
         docs = self.load_and_split_document(file_path)
@@ -65,14 +70,16 @@ class VectorStoreManager:
         if not self.vectorstore:
             self.create_or_load_vectorstore()
         
-        if self.vectorstore:
-            self.vectorstore.add_documents(docs)
-        else:
-            self.vectorstore = FAISS.from_documents(docs, self.embeddings)
+        with telemetry.span("vectorstore.embed", chunks=len(docs)):
+            if self.vectorstore:
+                self.vectorstore.add_documents(docs)
+            else:
+                self.vectorstore = FAISS.from_documents(docs, self.embeddings)
         
         self.save_vectorstore()
         return f"Added {file_path} to vectorstore."
     
+    @telemetry.traced("vectorstore.search")
     def search_documents(self, query: str) -> str:
         """Search relevant information from the document store"""
         if not self.vectorstore:
@@ -0,0 +1,44 @@
+import json
+from bench.run import compare_and_save, config_mismatches, find_regressions, parse_args, percentile
+
+CONFIG = {"iterations": 20, "warmup": 2, "llm_latency": 0.0, "http_latency": 0.0}
+
+
+def test_same_file_as_baseline_and_output_compares_before_overwriting(tmp_path):
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps({"config": CONFIG, "spans": {"llm.fake": {"p50_ms": 10.0}}}))
+    args = parse_args(["--baseline", str(path), "--output", str(path)])
+    spans = {"llm.fake": {"p50_ms": 20.0}}
+
+    assert compare_and_save(spans, CONFIG, args) == 1
+    assert json.loads(path.read_text())["spans"] == spans
+
+
+def test_percentile_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(values, 0) == 1
+    assert percentile([7], 95) == 7
+
+
+def test_find_regressions_respects_tolerance_and_noise_floor():
+    baseline = {
+        "slow": {"p50_ms": 10.0},
+        "ok": {"p50_ms": 10.0},
+        "tiny": {"p50_ms": 0.1},
+    }
+    current = {
+        "slow": {"p50_ms": 13.0},
+        "ok": {"p50_ms": 11.5},
+        "tiny": {"p50_ms": 0.5},
+        "new": {"p50_ms": 100.0},
+    }
+    assert find_regressions(current, baseline, tolerance=0.2, min_delta_ms=1.0) == [("slow", 10.0, 13.0)]
+
+
+def test_config_mismatches_lists_differing_settings():
+    current = {"iterations": 20, "llm_latency": 0.0}
+    assert config_mismatches(current, dict(current)) == []
+    assert config_mismatches(current, {"iterations": 20, "llm_latency": 0.5}) == [("llm_latency", 0.5, 0.0)]
+    assert config_mismatches(current, {}) == [("iterations", None, 20), ("llm_latency", None, 0.0)]
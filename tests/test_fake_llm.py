@@ -0,0 +1,65 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+from models.fake_llm import FakeChatModel
+
+
+@tool
+def lookup(query: str, limit: int = 3) -> str:
+    """Look something up."""
+    return query
+
+
+@tool
+def convert(amount: float) -> str:
+    """Convert an amount."""
+    return str(amount)
+
+
+def _model():
+    return FakeChatModel().bind_tools([lookup, convert])
+
+
+def test_tool_lines_become_calls_with_first_argument_name():
+    message = _model().invoke([HumanMessage("lookup: Eiffel Tower\nconvert:  12.5 ")])
+
+    assert message.content == ""
+    assert [(call["name"], call["args"]) for call in message.tool_calls] == [
+        ("lookup", {"query": "Eiffel Tower"}),
+        ("convert", {"amount": "12.5"}),
+    ]
+    assert [call["id"] for call in message.tool_calls] == ["call_1_0", "call_1_1"]
+
+
+def test_unbound_tools_and_plain_lines_are_ignored():
+    message = _model().invoke([HumanMessage("weather_tool: Cairo\nNote: lookup later")])
+
+    assert message.tool_calls == []
+    assert message.content == "Echo: weather_tool: Cairo\nNote: lookup later"
+
+
+def test_without_bound_tools_the_model_echoes():
+    message = FakeChatModel().invoke([HumanMessage("lookup: Eiffel Tower")])
+
+    assert message.tool_calls == []
+    assert message.content == "Echo: lookup: Eiffel Tower"
+
+
+def test_tool_results_produce_final_answer():
+    messages = [
+        HumanMessage("lookup: a\nconvert: 1"),
+        AIMessage("", tool_calls=[
+            {"name": "lookup", "args": {"query": "a"}, "id": "call_1_0"},
+            {"name": "convert", "args": {"amount": "1"}, "id": "call_1_1"},
+        ]),
+        ToolMessage("first", tool_call_id="call_1_0"),
+        ToolMessage("second", tool_call_id="call_1_1"),
+    ]
+    message = _model().invoke(messages)
+
+    assert message.tool_calls == []
+    assert message.content == "Answer from tools:\nfirst\nsecond"
+
+
+def test_responses_are_deterministic():
+    prompt = [HumanMessage("lookup: x")]
+    assert _model().invoke(prompt).tool_calls == _model().invoke(prompt).tool_calls
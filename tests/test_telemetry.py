@@ -0,0 +1,129 @@
+import json
+import uuid
+import pytest
+from config import Config
+from services.telemetry import METRIC_NAME, Telemetry, TelemetryCallbackHandler
+
+
+def _spans_by_name(trace):
+    return {span["name"]: span for span in trace["spans"]}
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Telemetry(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 2.0):
+        registry.observe("op", seconds)
+
+    metrics = registry.render_metrics()
+    labels = 'span="op",status="ok"'
+    assert f'{METRIC_NAME}_bucket{{{labels},le="0.1"}} 1' in metrics
+    assert f'{METRIC_NAME}_bucket{{{labels},le="1.0"}} 2' in metrics
+    assert f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} 3' in metrics
+    assert f"{METRIC_NAME}_count{{{labels}}} 3" in metrics
+    assert f"{METRIC_NAME}_sum{{{labels}}} 2.55" in metrics
+
+
+def test_render_metrics_format_and_label_escaping():
+    registry = Telemetry(buckets=(1.0,))
+    registry.observe('we"ird\\name', 0.5, "error")
+
+    lines = registry.render_metrics().splitlines()
+    assert lines[0].startswith(f"# HELP {METRIC_NAME} ")
+    assert lines[1] == f"# TYPE {METRIC_NAME} histogram"
+    assert f'{METRIC_NAME}_bucket{{span="we\\"ird\\\\name",status="error",le="1.0"}} 1' in lines
+
+
+def test_span_records_error_and_reraises():
+    registry = Telemetry(buckets=(1.0,))
+    with pytest.raises(ZeroDivisionError):
+        with registry.span("fails"):
+            1 / 0
+
+    assert 'span="fails",status="error"' in registry.render_metrics()
+
+
+def test_nested_spans_link_to_parents():
+    registry = Telemetry()
+    with registry.trace("request") as trace:
+        with registry.span("outer"):
+            with registry.span("inner"):
+                pass
+        with registry.span("sibling"):
+            pass
+
+    spans = _spans_by_name(trace)
+    assert spans["request"]["parent_id"] is None
+    assert spans["outer"]["parent_id"] == spans["request"]["span_id"]
+    assert spans["inner"]["parent_id"] == spans["outer"]["span_id"]
+    assert spans["sibling"]["parent_id"] == spans["request"]["span_id"]
+
+
+def test_nested_trace_joins_enclosing_trace_as_span():
+    registry = Telemetry()
+    with registry.trace("outer") as outer:
+        with registry.trace("inner") as inner:
+            with registry.span("work"):
+                pass
+
+    assert inner is outer
+    spans = _spans_by_name(outer)
+    assert set(spans) == {"outer", "inner", "work"}
+    assert spans["inner"]["parent_id"] == spans["outer"]["span_id"]
+    assert spans["work"]["parent_id"] == spans["inner"]["span_id"]
+
+
+def test_spans_outside_a_trace_only_feed_metrics():
+    registry = Telemetry()
+    with registry.span("standalone") as span:
+        pass
+
+    assert span.trace is None
+    assert 'span="standalone"' in registry.render_metrics()
+
+
+def test_trace_is_dumped_to_trace_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TRACE_DIR", str(tmp_path))
+    registry = Telemetry()
+    with registry.trace("request") as trace:
+        pass
+
+    path = tmp_path / f"request-{trace['trace_id']}.json"
+    assert json.loads(path.read_text())["spans"][0]["name"] == "request"
+
+
+def test_trace_dump_failure_does_not_break_request(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    monkeypatch.setattr(Config, "TRACE_DIR", str(blocker))
+    registry = Telemetry()
+
+    with registry.trace("request"):
+        result = "answer"
+    assert result == "answer"
+
+    with pytest.raises(KeyError):
+        with registry.trace("request"):
+            raise KeyError("original")
+
+
+def test_callback_handler_pairs_start_and_end():
+    registry = Telemetry(buckets=(1.0,))
+    handler = TelemetryCallbackHandler("llm.fake", registry=registry)
+
+    with registry.trace("request") as trace:
+        llm_run, tool_run, failed_run = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        handler.on_chat_model_start({}, [[]], run_id=llm_run)
+        handler.on_llm_end(None, run_id=llm_run)
+        handler.on_tool_start({"name": "calculator_tool"}, "1 + 1", run_id=tool_run)
+        handler.on_tool_end("2", run_id=tool_run)
+        handler.on_tool_start({"name": "weather_tool"}, "Cairo", run_id=failed_run)
+        handler.on_tool_error(RuntimeError("offline"), run_id=failed_run)
+        # An end without a matching start is ignored
+        handler.on_tool_end("orphan", run_id=uuid.uuid4())
+
+    spans = _spans_by_name(trace)
+    assert set(spans) == {"request", "llm.fake", "tool.calculator_tool", "tool.weather_tool"}
+    assert spans["tool.weather_tool"]["status"] == "error"
+    assert spans["tool.weather_tool"]["error"] == "RuntimeError: offline"
+    assert spans["llm.fake"]["parent_id"] == spans["request"]["span_id"]
+    assert handler._spans == {}
@@ -0,0 +1,51 @@
+import pytest
+from unittest import mock
+from langchain_core.callbacks import BaseCallbackHandler, CallbackManager
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+# tools.tools builds a VectorStoreManager at import; keep it off the real embedding model
+with mock.patch("services.vectorstore.HuggingFaceEmbeddings",
+                lambda model_name: DeterministicFakeEmbedding(size=8)):
+    from tools import tools as tools_module
+    from tools import ToolsManager
+
+
+@pytest.fixture(autouse=True)
+def restore_tool_callbacks(monkeypatch):
+    for t in (tools_module.calculator_tool, tools_module.weather_tool, tools_module.search_docs_tool):
+        monkeypatch.setattr(t, "callbacks", None)
+
+
+def _count_handler(callbacks):
+    handlers = callbacks.handlers if isinstance(callbacks, CallbackManager) else callbacks
+    return sum(h is tools_module._telemetry_handler for h in handlers)
+
+
+def test_handler_is_attached_once_across_managers():
+    ToolsManager().get_all_tools()
+    tools = ToolsManager().get_all_tools()
+    tools = ToolsManager().get_all_tools()
+
+    for t in tools:
+        assert _count_handler(t.callbacks) == 1
+
+
+def test_existing_callback_list_is_kept():
+    existing = BaseCallbackHandler()
+    tools_module.calculator_tool.callbacks = [existing]
+
+    ToolsManager().get_all_tools()
+
+    assert tools_module.calculator_tool.callbacks == [existing, tools_module._telemetry_handler]
+
+
+def test_existing_callback_manager_is_extended_in_place():
+    existing = BaseCallbackHandler()
+    manager = CallbackManager(handlers=[existing])
+    tools_module.weather_tool.callbacks = manager
+
+    ToolsManager().get_all_tools()
+    ToolsManager().get_all_tools()
+
+    assert tools_module.weather_tool.callbacks is manager
+    assert manager.handlers == [existing, tools_module._telemetry_handler]
@@ -5,10 +5,15 @@ from langchain_core.tools import tool
 from langchain_community.utilities import WikipediaAPIWrapper 
 from langchain_community.tools import WikipediaQueryRun
 from services.vectorstore import VectorStoreManager
+from langchain_core.callbacks import BaseCallbackManager
+from services.telemetry import TelemetryCallbackHandler
 
 # Create a global vectorstore manager instance for the tools
 _vectorstore_manager = VectorStoreManager()
 
+# Shared handler that times every tool run as a 'tool.<name>' span
+_telemetry_handler = TelemetryCallbackHandler()
+
 @tool
 def calculator_tool(expression: str) -> str:
     """Calculate expression using Python's numexpr library.
@@ -61,10 +66,22 @@ class ToolsManager:
         self.wikipedia_tool = WikipediaQueryRun(api_wrapper=self.api_wrapper)
     
     def get_all_tools(self):
-        """Returns list of all available tools"""
-        return [
+        """Returns list of all available tools, each timed as a 'tool.<name>' span"""
+        tools = [
             calculator_tool,
             weather_tool,
             search_docs_tool,
             self.wikipedia_tool
         ]
+        for t in tools:
+            self._add_telemetry_handler(t)
+        return tools
+    
+    @staticmethod
+    def _add_telemetry_handler(t):
+        """Attaches the shared telemetry handler to a tool, keeping its existing callbacks"""
+        if isinstance(t.callbacks, BaseCallbackManager):
+            if _telemetry_handler not in t.callbacks.handlers:
+                t.callbacks.add_handler(_telemetry_handler)
+        elif _telemetry_handler not in (t.callbacks or []):
+            t.callbacks = list(t.callbacks or []) + [_telemetry_handler]
@@ -1,7 +1,7 @@
 import streamlit as st
 from models import LLMFactory, AgentManager
 from tools import ToolsManager
-from services import VectorStoreManager, OCRManager
+from services import VectorStoreManager, OCRManager, telemetry, start_metrics_server
 from config import Config
 
 # Initialize managers
@@ -14,6 +14,13 @@ agent_manager = AgentManager()
 st.set_page_config(page_title="AI Agent", page_icon="🧠")
 st.title("AI Agent")
 
+# Metrics are optional: a busy port must not take the app down
+if Config.METRICS_PORT:
+    try:
+        start_metrics_server(Config.METRICS_PORT, Config.METRICS_HOST)
+    except OSError as e:
+        st.warning(f"Metrics endpoint disabled: could not bind port {Config.METRICS_PORT} ({e})")
+
 class StreamlitUI:
     """Main Streamlit UI class with modular functions"""
     
@@ -120,20 +127,21 @@ class StreamlitUI:
     
     def process_chat_query(self, user_query, uploaded_image):
         """Process chat query and return response"""
-        full_query = user_query
-        
-        # Add OCR context if image is uploaded
-        if uploaded_image is not None:
-            extracted_text = self.ocr_manager.process_uploaded_image(uploaded_image)
-            full_query += f"\n\nContext from image:\n{extracted_text}"
-        
-        # Get response from agent
-        llm = st.session_state.llm
-        tools = self.tools_manager.get_all_tools()
-        agent = self.agent_manager.create_react_agent(llm, tools)
-        thread_id = "default_user"  # Since no auth, use default
-        
-        return self.agent_manager.get_agent_response(agent, full_query, thread_id)
+        with telemetry.trace("chat.request"):
+            full_query = user_query
+            
+            # Add OCR context if image is uploaded
+            if uploaded_image is not None:
+                extracted_text = self.ocr_manager.process_uploaded_image(uploaded_image)
+                full_query += f"\n\nContext from image:\n{extracted_text}"
+            
+            # Get response from agent
+            llm = st.session_state.llm
+            tools = self.tools_manager.get_all_tools()
+            agent = self.agent_manager.create_react_agent(llm, tools)
+            thread_id = "default_user"  # Since no auth, use default
+            
+            return self.agent_manager.get_agent_response(agent, full_query, thread_id)
     
     def handle_chat_submission(self, user_query, uploaded_image):
         """Handle chat form submission with validation and error handling"""